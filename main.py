@@ -1,22 +1,113 @@
 """
 AI Agent for generating changelogs from git commits.
 """
+import asyncio
+import bisect
+import functools
 import os
+import subprocess
+import sys
+import threading
 from pathlib import Path
 from datetime import datetime
+import aiofiles
 from dotenv import load_dotenv
 from langchain_google_genai import ChatGoogleGenerativeAI
 from langchain.agents import create_agent
+from langchain_core.messages import AIMessage, AIMessageChunk
 from langgraph.checkpoint.memory import MemorySaver
 from tools import (
     get_commit_changes, get_commit_summary, get_commit_stats,
     get_staged_changes, get_staged_changes_summary, get_staged_changes_stats,
-    set_repo_path, get_repo_path
+    get_commit_numstat, get_commit_overview, set_repo_path, get_repo_path,
+    close as close_tools
 )
 
 # Load environment variables from .env file
 load_dotenv()
 
+_SYSTEM_PROMPT_STAGED = """You are a helpful AI assistant specialized in analyzing git staged changes and generating comprehensive changelogs.
+
+Your task is to:
+1. Fetch staged changes information (changes that are added but not yet committed)
+2. Analyze the changes that are ready to be committed
+3. Generate a well-structured changelog in markdown format that includes:
+   - Clear description of what changed
+   - List of files modified with their status (added, modified, deleted)
+   - Summary of additions/deletions
+   - Impact and purpose of the changes
+   - Suggestions for commit message if appropriate
+
+Be concise but thorough. Use proper markdown formatting."""
+
+_SYSTEM_PROMPT_COMMIT = """You are a helpful AI assistant specialized in analyzing git commits and generating comprehensive changelogs.
+
+Your task is to:
+1. Fetch commit information using the provided commit ID
+2. Analyze the changes made in the commit
+3. Generate a well-structured changelog in markdown format that includes:
+   - Commit ID and metadata (author, date)
+   - Clear description of what changed
+   - List of files modified
+   - Summary of additions/deletions
+   - Impact and purpose of the changes
+
+Be concise but thorough. Use proper markdown formatting."""
+
+# System prompt for each agent variant, keyed by for_staged
+SYSTEM_PROMPTS = {
+    False: _SYSTEM_PROMPT_COMMIT,
+    True: _SYSTEM_PROMPT_STAGED,
+}
+
+# Seconds a warm-up request may take before it is abandoned
+WARMUP_TIMEOUT = 5
+
+# One event loop for the whole session, so the async transport the memoized
+# agent opens on the first batch stays usable for later batches
+_ASYNC_RUNNER = asyncio.Runner()
+
+# Directory generated changelogs are saved to
+CHANGELOGS_DIR = Path("Changelogs")
+
+# Commits at or below both limits get a templated changelog without the LLM
+TRIVIAL_MAX_FILES = 3
+TRIVIAL_MAX_LINES = 20
+
+# Changed-line counts separating small/medium/large commits in batch mode
+DEFAULT_BIN_EDGES = "30,200"
+
+
+def _iter_markdown_blocks(content):
+    """
+    Yield each LangGraph content block rendered as a markdown string.
+    """
+    for block in content:
+        if isinstance(block, dict):
+            block_type = block.get('type')
+            block_text = block.get('text', '')
+            language = (block.get('language') or '') if block_type == 'code' else ''
+        elif hasattr(block, 'type') and hasattr(block, 'text'):
+            # Handle objects with type and text attributes
+            block_type = block.type
+            block_text = block.text
+            language = (getattr(block, 'language', None) or '') if block_type == 'code' else ''
+        else:
+            # Fallback: convert to string
+            yield str(block)
+            continue
+
+        if block_type == 'text':
+            yield block_text
+        elif block_type == 'code':
+            # Format as markdown code block
+            yield f"```{language}\n{block_text}\n```"
+        elif isinstance(block, dict):
+            # For any other type, just include the text
+            yield str(block.get('text', block))
+        else:
+            yield str(block_text)
+
 
 def extract_markdown_from_content(content):
     """
@@ -27,92 +118,68 @@ def extract_markdown_from_content(content):
         return content
 
     if isinstance(content, list):
-        markdown_parts = []
-        for block in content:
-            if isinstance(block, dict):
-                block_type = block.get('type', '')
-                block_text = block.get('text', '')
-
-                if block_type == 'text':
-                    markdown_parts.append(block_text)
-                elif block_type == 'code':
-                    language = block.get('language', '')
-                    code_text = block.get('text', '')
-                    # Format as markdown code block
-                    if language:
-                        markdown_parts.append(
-                            f"```{language}\n{code_text}\n```")
-                    else:
-                        markdown_parts.append(f"```\n{code_text}\n```")
-                else:
-                    # For any other type, just include the text
-                    markdown_parts.append(str(block.get('text', block)))
-            elif hasattr(block, 'type') and hasattr(block, 'text'):
-                # Handle objects with type and text attributes
-                if block.type == 'text':
-                    markdown_parts.append(block.text)
-                elif block.type == 'code':
-                    language = getattr(block, 'language', '')
-                    code_text = block.text
-                    if language:
-                        markdown_parts.append(
-                            f"```{language}\n{code_text}\n```")
-                    else:
-                        markdown_parts.append(f"```\n{code_text}\n```")
-                else:
-                    markdown_parts.append(str(block.text))
-            else:
-                # Fallback: convert to string
-                markdown_parts.append(str(block))
-
-        return '\n\n'.join(markdown_parts)
+        return '\n\n'.join(_iter_markdown_blocks(content))
 
     # Fallback: convert to string
     return str(content)
 
 
-def setup_agent(for_staged=False):
+@functools.lru_cache(maxsize=1)
+def setup_llm():
     """
-    Set up the LangGraph AI agent with Gemini model and git tools.
+    Set up the Gemini model, shared by both agents and the warm-up call.
+    Configured for the lowest latency: a single candidate, capped output
+    and no thinking tokens before the answer starts.
     """
-    # Initialize Gemini model
-    llm = ChatGoogleGenerativeAI(
+    return ChatGoogleGenerativeAI(
         model="gemini-flash-latest",
         temperature=0.7,
+        n=1,
+        max_output_tokens=int(os.getenv("GEMINI_MAX_OUTPUT_TOKENS", "2048")),
+        thinking_budget=int(os.getenv("GEMINI_THINKING_BUDGET", "0")),
     )
 
+
+def warm_up_llm():
+    """
+    Send a 1-token request in the background so the connection to Gemini
+    is already established when the next changelog is requested.
+    Disabled by setting CHANGELOG_PREWARM to 0, false, no or off.
+    """
+    if os.getenv("CHANGELOG_PREWARM", "1").strip().lower() in (
+            "0", "false", "no", "off"):
+        return
+
+    def _warm_up():
+        try:
+            # Single short attempt, a slow warm-up is not worth waiting for
+            setup_llm().invoke(
+                "warmup", generation_config={"max_output_tokens": 1},
+                timeout=WARMUP_TIMEOUT, max_retries=0)
+        except Exception:
+            # Best effort only, the real request will surface any error
+            pass
+
+    # Daemon thread, so exiting never waits on an in-flight warm-up
+    threading.Thread(target=_warm_up, daemon=True).start()
+
+
+@functools.lru_cache(maxsize=2)
+def setup_agent(for_staged=False):
+    """
+    Set up the LangGraph AI agent with Gemini model and git tools.
+    The agent is built once per variant and reused for later changelogs;
+    each run gets its own thread ID in the shared memory.
+    """
+    # Initialize Gemini model
+    llm = setup_llm()
+
     # Define tools based on whether analyzing staged changes or commits
     if for_staged:
         tools = [get_staged_changes, get_staged_changes_summary,
                  get_staged_changes_stats]
-        system_prompt = """You are a helpful AI assistant specialized in analyzing git staged changes and generating comprehensive changelogs.
-
-Your task is to:
-1. Fetch staged changes information (changes that are added but not yet committed)
-2. Analyze the changes that are ready to be committed
-3. Generate a well-structured changelog in markdown format that includes:
-   - Clear description of what changed
-   - List of files modified with their status (added, modified, deleted)
-   - Summary of additions/deletions
-   - Impact and purpose of the changes
-   - Suggestions for commit message if appropriate
-
-Be concise but thorough. Use proper markdown formatting."""
     else:
         tools = [get_commit_changes, get_commit_summary, get_commit_stats]
-        system_prompt = """You are a helpful AI assistant specialized in analyzing git commits and generating comprehensive changelogs.
-
-Your task is to:
-1. Fetch commit information using the provided commit ID
-2. Analyze the changes made in the commit
-3. Generate a well-structured changelog in markdown format that includes:
-   - Commit ID and metadata (author, date)
-   - Clear description of what changed
-   - List of files modified
-   - Summary of additions/deletions
-   - Impact and purpose of the changes
-
-Be concise but thorough. Use proper markdown formatting."""
 
     # Create agent with memory using LangGraph
     memory = MemorySaver()
@@ -120,12 +187,68 @@ Be concise but thorough. Use proper markdown formatting."""
         llm,
         tools,
         checkpointer=memory,
-        system_prompt=system_prompt
+        system_prompt=SYSTEM_PROMPTS[for_staged]
     )
 
     return agent
 
 
+def last_ai_content(messages) -> str:
+    """
+    Extract markdown from the final AI message in an agent's message list.
+
+    Args:
+        messages: The messages from the agent's final state
+
+    Returns:
+        Markdown of the last AI message with content, or an empty string
+    """
+    last = next((msg for msg in reversed(messages)
+                 if isinstance(msg, AIMessage) and msg.content), None)
+    return extract_markdown_from_content(last.content) if last else ""
+
+
+def stream_agent_response(agent, user_query: str, thread_id: str) -> str:
+    """
+    Run the agent and print the model's tokens to stdout as they arrive.
+
+    Args:
+        agent: The LangGraph agent to run
+        user_query: The user message to send to the agent
+        thread_id: The thread ID used by the agent's checkpointer
+
+    Returns:
+        Markdown of the agent's final answer
+    """
+    config = {"configurable": {"thread_id": thread_id}}
+    for chunk, _metadata in agent.stream(
+        {"messages": [{"role": "user", "content": user_query}]},
+        config,
+        stream_mode="messages"
+    ):
+        # Only model output is streamed, tool results are skipped
+        if not isinstance(chunk, AIMessageChunk) or not chunk.content:
+            continue
+
+        sys.stdout.write(extract_markdown_from_content(chunk.content))
+        sys.stdout.flush()
+
+    # Text from tool-calling turns is streamed too, so the changelog is
+    # taken from the terminal message only
+    return last_ai_content(agent.get_state(config).values["messages"])
+
+
+def _changelog_filepath(identifier: str, is_staged=False) -> Path:
+    """
+    Build the path of the markdown file a changelog is saved to.
+    """
+    if is_staged:
+        # For staged changes, use timestamp
+        timestamp = datetime.now().strftime("%Y%m%d_%H%M%S")
+        return CHANGELOGS_DIR / f"staged_{timestamp}.md"
+    return CHANGELOGS_DIR / f"{identifier}.md"
+
+
 def save_changelog(identifier: str, changelog_content, is_staged=False):
     """
     Save the generated changelog to a markdown file.
@@ -136,29 +259,85 @@ def save_changelog(identifier: str, changelog_content, is_staged=False):
         is_staged: Whether this is for staged changes (uncommitted)
     """
     # Ensure content is properly formatted as markdown string
-    if isinstance(changelog_content, str):
-        content_str = changelog_content
-    else:
-        content_str = extract_markdown_from_content(changelog_content)
+    content_str = extract_markdown_from_content(changelog_content)
 
     # Create Changelogs directory if it doesn't exist
-    changelogs_dir = Path("Changelogs")
-    changelogs_dir.mkdir(exist_ok=True)
-
-    # Save changelog with appropriate filename
-    if is_staged:
-        # For staged changes, use timestamp
-        timestamp = datetime.now().strftime("%Y%m%d_%H%M%S")
-        filepath = changelogs_dir / f"staged_{timestamp}.md"
-    else:
-        filepath = changelogs_dir / f"{identifier}.md"
+    os.makedirs(CHANGELOGS_DIR, exist_ok=True)
 
+    filepath = _changelog_filepath(identifier, is_staged)
     with open(filepath, 'w', encoding='utf-8') as f:
         f.write(content_str)
 
     print(f"\n✓ Changelog saved to: {filepath}")
 
 
+async def save_changelog_async(identifier: str, changelog_content, is_staged=False):
+    """
+    Save the generated changelog to a markdown file without blocking the event loop.
+    The Changelogs directory must already exist.
+
+    Args:
+        identifier: The commit ID or identifier for the changelog
+        changelog_content: The changelog content to save (will be converted to string)
+        is_staged: Whether this is for staged changes (uncommitted)
+    """
+    content_str = extract_markdown_from_content(changelog_content)
+
+    filepath = _changelog_filepath(identifier, is_staged)
+    async with aiofiles.open(filepath, 'w', encoding='utf-8') as f:
+        await f.write(content_str)
+
+    print(f"\n✓ Changelog saved to: {filepath}")
+
+
+def build_commit_query(commit_id: str) -> str:
+    """
+    Build the user query asking the agent for a commit's changelog.
+    """
+    return f"""Generate a comprehensive changelog for commit ID: {commit_id}
+
+Please:
+1. Fetch the commit information
+2. Analyze all changes made
+3. Create a well-structured markdown changelog
+
+Format the changelog with proper markdown syntax including headers, lists, and code blocks where appropriate."""
+
+
+def build_trivial_changelog(commit_id: str):
+    """
+    Build a changelog from a template for commits too small to need the LLM.
+
+    Args:
+        commit_id: The git commit hash/ID
+
+    Returns:
+        The markdown changelog, or None if the commit is not trivial or
+        cannot be read (the agent then handles it)
+    """
+    try:
+        overview = get_commit_overview(commit_id)
+    except Exception:
+        return None
+
+    # Merges and empty commits have no file list and go to the agent
+    if (not overview['files']
+            or overview['files_changed'] > TRIVIAL_MAX_FILES
+            or overview['insertions'] + overview['deletions'] > TRIVIAL_MAX_LINES):
+        return None
+
+    files = ', '.join(f"`{' -> '.join(paths)}` ({status[0]})"
+                      for status, paths in overview['files'])
+    return f"""## {overview['subject']}
+
+- **Commit:** `{overview['sha']}`
+- **Author:** {overview['author']}
+- **Date:** {overview['date']}
+- **Files:** {files}
+- **Changes:** +{overview['insertions']}/-{overview['deletions']}
+"""
+
+
 def generate_changelog(commit_id: str, repo_path=None):
     """
     Generate a changelog for a specific commit ID.
@@ -173,39 +352,30 @@ def generate_changelog(commit_id: str, repo_path=None):
     else:
         print(f"📁 Repository: Current directory\n")
 
-    # Set up agent
-    agent = setup_agent()
+    try:
+        print("\n" + "="*80)
+        print("Generated Changelog:")
+        print("="*80)
 
-    # Run agent to generate changelog
-    user_query = f"""Generate a comprehensive changelog for commit ID: {commit_id}
+        # Small commits skip the LLM round-trip entirely
+        changelog_content = build_trivial_changelog(commit_id)
+        if changelog_content is not None:
+            print(changelog_content)
+        else:
+            # Set up agent
+            agent = setup_agent(for_staged=False)
 
-Please:
-1. Fetch the commit information
-2. Analyze all changes made
-3. Create a well-structured markdown changelog
+            # Run agent to generate changelog
+            user_query = build_commit_query(commit_id)
 
-Format the changelog with proper markdown syntax including headers, lists, and code blocks where appropriate."""
+            # Unique thread ID so reruns on the same commit start fresh
+            timestamp = datetime.now().strftime("%Y%m%d_%H%M%S")
 
-    try:
-        # Invoke agent with LangGraph pattern
-        result = agent.invoke(
-            {"messages": [{"role": "user", "content": user_query}]},
-            {"configurable": {"thread_id": f"commit-{commit_id}"}}
-        )
-
-        # Extract the final assistant message
-        changelog_content = ""
-        for msg in result["messages"]:
-            if hasattr(msg, "role") and msg.role == "assistant":
-                changelog_content = extract_markdown_from_content(msg.content)
-            elif msg.__class__.__name__ == "AIMessage" and msg.content:
-                changelog_content = extract_markdown_from_content(msg.content)
+            # Stream agent output with LangGraph pattern
+            changelog_content = stream_agent_response(
+                agent, user_query, f"commit-{commit_id}-{timestamp}")
 
         print("\n" + "="*80)
-        print("Generated Changelog:")
-        print("="*80)
-        print(changelog_content)
-        print("="*80)
 
         # Save changelog
         save_changelog(commit_id, changelog_content)
@@ -247,25 +417,15 @@ Format the changelog with proper markdown syntax including headers, lists, and c
         # Generate unique thread ID for this staged analysis
         timestamp = datetime.now().strftime("%Y%m%d_%H%M%S")
 
-        # Invoke agent with LangGraph pattern
-        result = agent.invoke(
-            {"messages": [{"role": "user", "content": user_query}]},
-            {"configurable": {"thread_id": f"staged-{timestamp}"}}
-        )
-
-        # Extract the final assistant message
-        changelog_content = ""
-        for msg in result["messages"]:
-            if hasattr(msg, "role") and msg.role == "assistant":
-                changelog_content = extract_markdown_from_content(msg.content)
-            elif msg.__class__.__name__ == "AIMessage" and msg.content:
-                changelog_content = extract_markdown_from_content(msg.content)
-
         print("\n" + "="*80)
         print("Generated Changelog (Staged Changes):")
         print("="*80)
-        print(changelog_content)
-        print("="*80)
+
+        # Stream agent output with LangGraph pattern
+        changelog_content = stream_agent_response(
+            agent, user_query, f"staged-{timestamp}")
+
+        print("\n" + "="*80)
 
         # Save changelog with timestamp
         save_changelog(timestamp, changelog_content, is_staged=True)
@@ -276,6 +436,119 @@ Format the changelog with proper markdown syntax including headers, lists, and c
         return None
 
 
+@functools.lru_cache(maxsize=1)
+def get_bin_edges() -> tuple:
+    """
+    Parse the batch bin edges from the CHANGELOG_BIN_EDGES environment
+    variable (comma-separated line counts, default "30,200").
+    Invalid values fall back to the default with a warning.
+    """
+    value = os.getenv("CHANGELOG_BIN_EDGES", DEFAULT_BIN_EDGES)
+    try:
+        return tuple(sorted(int(edge) for edge in value.split(',') if edge.strip()))
+    except ValueError:
+        print(f"⚠️  Warning: Invalid CHANGELOG_BIN_EDGES '{value}', "
+              f"using default '{DEFAULT_BIN_EDGES}'.")
+        return tuple(int(edge) for edge in DEFAULT_BIN_EDGES.split(','))
+
+
+def bin_commits_by_size(commit_ids: list) -> list:
+    """
+    Group commits into bins by the number of changed lines, using the
+    edges from get_bin_edges.
+
+    Returns:
+        List of commit ID lists, smallest commits first
+    """
+    edges = get_bin_edges()
+    bins = [[] for _ in range(len(edges) + 1)]
+
+    for commit_id in commit_ids:
+        try:
+            _files, insertions, deletions = get_commit_numstat(commit_id)
+            index = bisect.bisect_right(edges, insertions + deletions)
+        except Exception:
+            # Let the agent report the error, in the last bin
+            index = len(edges)
+        bins[index].append(commit_id)
+
+    return [commit_bin for commit_bin in bins if commit_bin]
+
+
+async def _generate_changelogs_async(commit_ids: list):
+    """
+    Run the agent for all commits, concurrently within each size bin,
+    saving each changelog as soon as it is generated.
+
+    Small commits are dispatched together before larger ones so they are
+    not held up behind long generations.
+
+    Returns:
+        List of (commit_id, changelog_content or exception) tuples
+    """
+    agent = setup_agent(for_staged=False)
+    timestamp = datetime.now().strftime("%Y%m%d_%H%M%S")
+
+    async def _one(commit_id: str):
+        try:
+            # Git reads block, keep them off the event loop
+            changelog_content = await asyncio.to_thread(
+                build_trivial_changelog, commit_id)
+            if changelog_content is None:
+                result = await agent.ainvoke(
+                    {"messages": [{"role": "user",
+                                   "content": build_commit_query(commit_id)}]},
+                    {"configurable": {"thread_id": f"commit-{commit_id}-{timestamp}"}}
+                )
+                changelog_content = last_ai_content(result["messages"])
+            await save_changelog_async(commit_id, changelog_content)
+            return commit_id, changelog_content
+        except Exception as e:
+            return commit_id, e
+
+    # Created once up front rather than on every save
+    os.makedirs(CHANGELOGS_DIR, exist_ok=True)
+
+    results = {}
+    for commit_bin in await asyncio.to_thread(bin_commits_by_size, commit_ids):
+        results.update(await asyncio.gather(
+            *[_one(commit_id) for commit_id in commit_bin]))
+
+    return [(commit_id, results[commit_id]) for commit_id in commit_ids]
+
+
+def generate_changelogs(commit_ids: list, repo_path=None):
+    """
+    Generate changelogs for several commits, running the LLM calls concurrently.
+
+    Args:
+        commit_ids: The git commit hashes/IDs to generate changelogs for
+        repo_path: Path to the git repository (optional, uses current dir if not provided)
+
+    Returns:
+        Dict mapping each commit ID to its changelog, or None if it failed
+    """
+    # Drop duplicates, they would write the same file
+    commit_ids = list(dict.fromkeys(commit_ids))
+
+    print(f"\n🚀 Generating changelogs for {len(commit_ids)} commits")
+    if repo_path:
+        print(f"📁 Repository: {repo_path}\n")
+    else:
+        print("📁 Repository: Current directory\n")
+
+    changelogs = {}
+    for commit_id, result in _ASYNC_RUNNER.run(_generate_changelogs_async(commit_ids)):
+        if isinstance(result, Exception):
+            print(f"Error generating changelog for {commit_id}: {str(result)}")
+            changelogs[commit_id] = None
+            continue
+
+        changelogs[commit_id] = result
+
+    return changelogs
+
+
 def main():
     """
     Main function to run the changelog generator.
@@ -302,14 +575,17 @@ def main():
         if not repo_path.exists():
             print(f"❌ Error: Path '{repo_path}' does not exist.")
             return
-        if not (repo_path / ".git").exists():
+        try:
+            set_repo_path(str(repo_path))
+        except subprocess.CalledProcessError:
             print(f"❌ Error: '{repo_path}' is not a git repository.")
             return
-        set_repo_path(str(repo_path))
         print(f"✓ Using repository: {repo_path}")
     else:
         # Check if current directory is a git repo
-        if not Path(".git").exists():
+        try:
+            set_repo_path(".")
+        except subprocess.CalledProcessError:
             print("❌ Error: Current directory is not a git repository.")
             print("Please provide a valid git repository path.")
             return
@@ -321,7 +597,8 @@ def main():
     print("\nWhat would you like to analyze?")
     print("1. Staged changes (uncommitted, ready to commit)")
     print("2. Existing commit (using commit ID)")
-    choice = input("\nEnter choice (1 or 2): ").strip()
+    print("3. Multiple commits (batch, using commit IDs)")
+    choice = input("\nEnter choice (1, 2 or 3): ").strip()
 
     if choice == "1":
         # Generate changelog for staged changes
@@ -334,6 +611,15 @@ def main():
             print("No commit ID provided. Exiting.")
             return
         generate_changelog(commit_id, str(repo_path) if repo_path else None)
+    elif choice == "3":
+        # Get commit IDs
+        commit_ids = input(
+            "\nEnter commit IDs (separated by spaces or commas): ").replace(',', ' ').split()
+        if not commit_ids:
+            print("No commit IDs provided. Exiting.")
+            return
+        generate_changelogs(
+            commit_ids, str(repo_path) if repo_path else None)
     else:
         print("Invalid choice. Exiting.")
         return
@@ -343,6 +629,8 @@ def main():
         another = input(
             "\n\nGenerate another changelog? (y/n): ").strip().lower()
         if another == 'y':
+            # Warm the connection while the next request is being entered
+            warm_up_llm()
             change_repo = input(
                 "Use a different repository? (y/n): ").strip().lower()
             if change_repo == 'y':
@@ -350,17 +638,22 @@ def main():
                     "Enter the path to git repository: ").strip()
                 if new_repo_path:
                     new_repo_path = Path(new_repo_path).resolve()
-                    if not new_repo_path.exists() or not (new_repo_path / ".git").exists():
-                        print(f"❌ Error: Invalid git repository path.")
+                    if not new_repo_path.exists():
+                        print("❌ Error: Invalid git repository path.")
+                        continue
+                    try:
+                        set_repo_path(str(new_repo_path))
+                    except subprocess.CalledProcessError:
+                        print("❌ Error: Invalid git repository path.")
                         continue
-                    set_repo_path(str(new_repo_path))
                     print(f"✓ Switched to repository: {new_repo_path}")
 
             # Ask what to analyze
             print("\nWhat would you like to analyze?")
             print("1. Staged changes (uncommitted)")
             print("2. Existing commit")
-            choice = input("Enter choice (1 or 2): ").strip()
+            print("3. Multiple commits (batch)")
+            choice = input("Enter choice (1, 2 or 3): ").strip()
 
             if choice == "1":
                 current_repo = get_repo_path() if get_repo_path() else None
@@ -370,13 +663,26 @@ def main():
                 if commit_id:
                     current_repo = get_repo_path() if get_repo_path() else None
                     generate_changelog(commit_id, current_repo)
+            elif choice == "3":
+                commit_ids = input(
+                    "Enter commit IDs: ").replace(',', ' ').split()
+                if commit_ids:
+                    current_repo = get_repo_path() if get_repo_path() else None
+                    generate_changelogs(commit_ids, current_repo)
             else:
                 print("Invalid choice.")
         else:
             break
 
+    _ASYNC_RUNNER.close()
+    close_tools()
     print("\n✓ Done! Thank you for using AI Changelog Generator.")
 
 
 if __name__ == "__main__":
-    main()
+    try:
+        main()
+    finally:
+        # Also covers early returns and Ctrl-C
+        _ASYNC_RUNNER.close()
+        close_tools()
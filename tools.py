@@ -1,7 +1,13 @@
 """
 Git commit tools for fetching commit information and changes.
 """
+import os
+import re
 import subprocess
+import textwrap
+import threading
+from functools import lru_cache
+from datetime import datetime, timedelta, timezone
 from typing import Optional
 from langchain.tools import tool
 from pathlib import Path
@@ -9,11 +15,98 @@ from pathlib import Path
 # Global variable to store the repository path
 _REPO_PATH = None
 
+# The tools only read from the repository, so git is told to skip optional
+# index locks and the fsmonitor daemon
+_GIT_READ_ONLY = ['git', '--no-optional-locks', '-c', 'core.fsmonitor=false']
+_GIT_ENV = {**os.environ, 'GIT_OPTIONAL_LOCKS': '0'}
+
+# Git command prefix pointing at the resolved repository, set by set_repo_path
+_GIT_CMD_BASE = None
+
+# Persistent `git cat-file --batch` process for reading objects
+_CATFILE = None
+_CATFILE_LOCK = threading.Lock()
+
+# Diffs longer than this are truncated before being handed to the LLM
+MAX_DIFF_BYTES = 20_000
+
+# Output templates of the commit tools
+_COMMIT_CHANGES_TEMPLATE = textwrap.dedent("""
+    Commit Information:
+    commit {sha}
+    {merge}Author:     {author_name} <{author_email}>
+    AuthorDate: {author_date}
+    Commit:     {committer_name} <{committer_email}>
+    CommitDate: {committer_date}
+
+    {message}
+
+    Changes:
+    {patch}
+    """)
+
+_COMMIT_SUMMARY_TEMPLATE = textwrap.dedent("""
+    Commit ID: {sha}
+    Author: {author_name} <{author_email}>
+    Date: {author_date}
+    Subject: {subject}
+
+    Files Changed:
+    {files}
+    """)
+
+_COMMIT_STATS_TEMPLATE = textwrap.dedent("""\
+    commit {sha}
+    {merge}Author: {author_name} <{author_email}>
+    Date:   {author_date}
+
+    {message}
+
+    {stat}""")
+
+_NUMSTAT_RE = re.compile(rb'(\d+|-)\t(\d+|-)\t')
+_IDENT_RE = re.compile(r'(.*) <(.*)> (\d+) ([+-])(\d\d)(\d\d)$')
+
 
 def set_repo_path(repo_path: str):
-    """Set the repository path for git operations."""
-    global _REPO_PATH
-    _REPO_PATH = str(Path(repo_path).resolve())
+    """
+    Set the repository path for git operations.
+
+    The git directory and work tree are resolved once here, so later git
+    calls point straight at the repository instead of rediscovering it.
+
+    Raises:
+        subprocess.CalledProcessError: If repo_path is not a git repository
+    """
+    global _REPO_PATH, _GIT_CMD_BASE
+    previous_repo_path = _REPO_PATH
+    resolved_path = str(Path(repo_path).resolve())
+
+    # Raises CalledProcessError if the path is not inside a git repository
+    git_dir, inside_work_tree, cdup = subprocess.run(
+        _GIT_READ_ONLY + ['-C', resolved_path, 'rev-parse', '--absolute-git-dir',
+                          '--is-inside-work-tree', '--show-cdup'],
+        capture_output=True,
+        check=True,
+        env=_GIT_ENV
+    ).stdout.decode().split('\n')[:3]
+
+    _REPO_PATH = resolved_path
+    _GIT_CMD_BASE = _GIT_READ_ONLY + ['--git-dir', git_dir]
+    if inside_work_tree == 'true':
+        work_tree = str((Path(_REPO_PATH) / cdup).resolve())
+        _GIT_CMD_BASE += ['--work-tree', work_tree, '-C', work_tree]
+
+    with _CATFILE_LOCK:
+        _stop_catfile()
+        _start_catfile()
+
+    # Cached results are keyed by repository, drop those of the old one
+    if _REPO_PATH != previous_repo_path:
+        _load_commit.cache_clear()
+        _get_commit_changes_impl.cache_clear()
+        _get_commit_summary_impl.cache_clear()
+        _get_commit_stats_impl.cache_clear()
 
 
 def get_repo_path() -> Optional[str]:
@@ -21,10 +114,329 @@ def get_repo_path() -> Optional[str]:
     return _REPO_PATH
 
 
+def close():
+    """Stop the background git process used for reading objects."""
+    with _CATFILE_LOCK:
+        _stop_catfile()
+
+
+def _git(args: list) -> bytes:
+    """
+    Run a git command against the current repository and return its raw output.
+
+    Output is left as bytes so large diffs are decoded only once, where the
+    text is needed. On failure the CalledProcessError carries decoded stderr.
+    """
+    git_cmd_base = _GIT_CMD_BASE if _GIT_CMD_BASE else _GIT_READ_ONLY
+    result = subprocess.run(
+        git_cmd_base + args,
+        capture_output=True,
+        env=_GIT_ENV
+    )
+    if result.returncode:
+        raise subprocess.CalledProcessError(
+            result.returncode, result.args, result.stdout,
+            result.stderr.decode('utf-8', 'replace'))
+    return result.stdout
+
+
+def _truncate_diff(patch: bytes) -> str:
+    """
+    Decode a patch, cutting it at the last full line within MAX_DIFF_BYTES.
+    """
+    if len(patch) <= MAX_DIFF_BYTES:
+        return patch.decode('utf-8', 'replace')
+
+    cut = patch.rfind(b'\n', 0, MAX_DIFF_BYTES) + 1 or MAX_DIFF_BYTES
+    return (patch[:cut].decode('utf-8', 'replace')
+            + f"\n...[truncated {len(patch) - cut} bytes; "
+            "see the stats tool for all changed files]\n")
+
+
+def _parse_diff(output: bytes) -> dict:
+    """
+    Parse `-z --raw --numstat --patch` output into its sections.
+
+    Returns:
+        Dict with 'files' (status, paths), 'numstat' (added, deleted, path)
+        and 'patch' entries, decoded to text
+    """
+    files = []
+    rest = output.lstrip(b'\0\n')
+    while rest.startswith(b':'):
+        meta, _, rest = rest.partition(b'\0')
+        path, _, rest = rest.partition(b'\0')
+        status = meta.split()[-1].decode()
+        paths = [path.decode('utf-8', 'replace')]
+        # Renames and copies are followed by the destination path
+        if status[0] in 'RC':
+            new_path, _, rest = rest.partition(b'\0')
+            paths.append(new_path.decode('utf-8', 'replace'))
+        files.append((status, paths))
+
+    numstat = []
+    rest = rest.lstrip(b'\0\n')
+    while _NUMSTAT_RE.match(rest):
+        entry, _, rest = rest.partition(b'\0')
+        added, deleted, path = entry.decode('utf-8', 'replace').split('\t', 2)
+        if not path:
+            old_path, _, rest = rest.partition(b'\0')
+            new_path, _, rest = rest.partition(b'\0')
+            path = (f"{old_path.decode('utf-8', 'replace')} => "
+                    f"{new_path.decode('utf-8', 'replace')}")
+        numstat.append((added, deleted, path))
+
+    patch = _truncate_diff(rest.lstrip(b'\0\n'))
+    return {'files': files, 'numstat': numstat, 'patch': patch}
+
+
+def _start_catfile():
+    """Start the `git cat-file --batch` process for the current repository."""
+    global _CATFILE
+    git_cmd_base = _GIT_CMD_BASE if _GIT_CMD_BASE else _GIT_READ_ONLY
+    _CATFILE = subprocess.Popen(
+        git_cmd_base + ['cat-file', '--batch'],
+        stdin=subprocess.PIPE,
+        stdout=subprocess.PIPE,
+        stderr=subprocess.DEVNULL,
+        env=_GIT_ENV
+    )
+
+
+def _stop_catfile():
+    """Stop the `git cat-file --batch` process, if running."""
+    global _CATFILE
+    if _CATFILE is not None:
+        _CATFILE.stdin.close()
+        _CATFILE.wait()
+        _CATFILE = None
+
+
+def _read_object(rev: str, kind: str) -> tuple:
+    """
+    Read an object through the persistent `git cat-file --batch` process.
+
+    Args:
+        rev: Any revision expression naming the object
+        kind: The object type to peel the revision to (e.g. 'commit')
+
+    Returns:
+        Tuple of (full object hash, object content as bytes)
+    """
+    if '\n' in rev:
+        raise ValueError(f"Invalid revision: {rev!r}")
+
+    with _CATFILE_LOCK:
+        if _CATFILE is None or _CATFILE.poll() is not None:
+            _start_catfile()
+        _CATFILE.stdin.write(f"{rev}^{{{kind}}}\n".encode())
+        _CATFILE.stdin.flush()
+
+        # "<sha> <type> <size>", or "<rev> missing" / "<rev> ambiguous"
+        # where <rev> is echoed back and may itself contain spaces
+        header = _CATFILE.stdout.readline().decode('utf-8', 'replace').rstrip('\n')
+        if header.rsplit(' ', 1)[-1] in ('missing', 'ambiguous'):
+            raise ValueError(f"Unknown revision: {rev}")
+        sha, _kind, size = header.rsplit(' ', 2)
+        # Content is followed by a newline
+        data = _CATFILE.stdout.read(int(size) + 1)[:-1]
+
+    return sha, data
+
+
+def _format_ident(ident: str) -> tuple:
+    """Split an author/committer line into (name, email, date) like `git log`."""
+    match = _IDENT_RE.match(ident)
+    if not match:
+        return ident, '', ''
+    name, email, timestamp, sign, hours, minutes = match.groups()
+    offset = timedelta(hours=int(hours), minutes=int(minutes))
+    try:
+        date = datetime.fromtimestamp(
+            int(timestamp), timezone(-offset if sign == '-' else offset))
+    except (ValueError, OverflowError, OSError):
+        # Offsets of a day or more and out-of-range timestamps can't be
+        # represented, keep the raw values rather than failing the commit
+        return name, email, f"{timestamp} {sign}{hours}{minutes}"
+    return name, email, (f"{date:%a %b} {date.day} {date:%H:%M:%S %Y} "
+                         f"{sign}{hours}{minutes}")
+
+
+def _format_merge(parents: list) -> str:
+    """Return the `Merge:` line `git log` prints for merge commits, if any."""
+    if len(parents) < 2:
+        return ''
+    return f"Merge: {' '.join(parent[:7] for parent in parents)}\n"
+
+
+def _parse_commit_object(sha: str, data: bytes) -> dict:
+    """Parse a raw commit object into its header fields and message."""
+    # Commits made with i18n.commitEncoding record it in an encoding header;
+    # like `git log`, decode the whole object with it
+    encoding = 'utf-8'
+    for line in data.partition(b'\n\n')[0].split(b'\n'):
+        if line.startswith(b'encoding '):
+            encoding = line[len(b'encoding '):].decode('ascii', 'replace')
+    try:
+        text = data.decode(encoding, 'replace')
+    except LookupError:
+        text = data.decode('utf-8', 'replace')
+
+    header, _, message = text.partition('\n\n')
+    subject, body = (message.strip().split('\n', 1) + [''])[:2]
+    commit = {'sha': sha, 'message': message, 'parents': [],
+              'subject': subject or 'N/A', 'body': body.strip()}
+    for line in header.split('\n'):
+        field, _, value = line.partition(' ')
+        if field == 'parent':
+            commit['parents'].append(value)
+        elif field in ('author', 'committer'):
+            (commit[f'{field}_name'], commit[f'{field}_email'],
+             commit[f'{field}_date']) = _format_ident(value)
+    return commit
+
+
+def _resolve_commit(commit_id: str) -> str:
+    """Resolve any commit ID or ref to its full commit hash."""
+    return _read_object(commit_id, 'commit')[0]
+
+
+@lru_cache(maxsize=256)
+def _load_commit(repo_path: Optional[str], sha: str) -> dict:
+    """
+    Fetch and parse a commit by its full hash.
+
+    The commit object is read through the persistent cat-file process;
+    only the diff needs a `git show` call. repo_path is part of the cache
+    key so commits from different repositories never collide.
+    """
+    _sha, data = _read_object(sha, 'commit')
+    commit = _parse_commit_object(sha, data)
+    commit.update(_parse_diff(_git(['show', '-z', '--format=', '--raw',
+                                    '--numstat', '--patch', sha])))
+    return commit
+
+
+def _get_commit(commit_id: str) -> dict:
+    """Fetch and parse a commit of the current repository."""
+    return _load_commit(get_repo_path(), _resolve_commit(commit_id))
+
+
+def _load_staged() -> dict:
+    """Fetch and parse the staged changes with a single `git diff` invocation."""
+    return _parse_diff(_git(['diff', '--cached', '-z', '--raw',
+                             '--numstat', '--patch']))
+
+
+def _format_name_status(files: list) -> str:
+    """Format parsed raw entries like `git diff --name-status`."""
+    return ''.join(status + '\t' + '\t'.join(paths) + '\n'
+                   for status, paths in files)
+
+
+def _format_numstat(numstat: list) -> str:
+    """Format parsed numstat entries like `git diff --numstat`."""
+    return ''.join(f"{added}\t{deleted}\t{path}\n"
+                   for added, deleted, path in numstat)
+
+
+def _sum_numstat(numstat: list) -> tuple:
+    """Return (files changed, insertions, deletions) for numstat entries."""
+    insertions = deletions = 0
+    for added, deleted, _path in numstat:
+        # Binary files report '-' for both counts
+        if added != '-':
+            insertions += int(added)
+            deletions += int(deleted)
+    return len(numstat), insertions, deletions
+
+
+def _format_stat(numstat: list) -> str:
+    """Format parsed numstat entries as a per-file stat with a summary line."""
+    lines = []
+    for added, deleted, path in numstat:
+        if added == '-':
+            lines.append(f" {path} | Bin")
+        else:
+            lines.append(f" {path} | +{added} -{deleted}")
+
+    changed, insertions, deletions = _sum_numstat(numstat)
+    summary = f" {changed} file{'s' if changed != 1 else ''} changed"
+    if insertions:
+        summary += f", {insertions} insertion{'s' if insertions != 1 else ''}(+)"
+    if deletions:
+        summary += f", {deletions} deletion{'s' if deletions != 1 else ''}(-)"
+    lines.append(summary)
+    return '\n'.join(lines) + '\n'
+
+
+def _indent_message(message: str) -> str:
+    """Indent a commit message the way `git log` does."""
+    return '\n'.join(f"    {line}" if line else ''
+                     for line in message.rstrip('\n').split('\n'))
+
+
+def get_commit_numstat(commit_id: str) -> tuple:
+    """
+    Get the size of a commit without going through the agent.
+
+    Args:
+        commit_id: The git commit hash/ID
+
+    Returns:
+        Tuple of (files changed, insertions, deletions)
+    """
+    return _sum_numstat(_get_commit(commit_id)['numstat'])
+
+
+def get_commit_overview(commit_id: str) -> dict:
+    """
+    Get commit metadata and size without going through the agent.
+
+    Args:
+        commit_id: The git commit hash/ID
+
+    Returns:
+        Dict with 'sha', 'author', 'date', 'subject', 'files' (list of
+        (status, paths) tuples), 'files_changed', 'insertions' and 'deletions'
+    """
+    commit = _get_commit(commit_id)
+    files_changed, insertions, deletions = _sum_numstat(commit['numstat'])
+    return {
+        'sha': commit['sha'],
+        'author': f"{commit['author_name']} <{commit['author_email']}>",
+        'date': commit['author_date'],
+        'subject': commit['subject'],
+        'files': commit['files'],
+        'files_changed': files_changed,
+        'insertions': insertions,
+        'deletions': deletions,
+    }
+
+
+@lru_cache(maxsize=256)
+def _get_commit_changes_impl(repo_path: Optional[str], sha: str) -> str:
+    """Format the get_commit_changes tool output for a commit."""
+    commit = _load_commit(repo_path, sha)
+    return _COMMIT_CHANGES_TEMPLATE.format(
+        sha=commit['sha'],
+        merge=_format_merge(commit['parents']),
+        author_name=commit['author_name'],
+        author_email=commit['author_email'],
+        author_date=commit['author_date'],
+        committer_name=commit['committer_name'],
+        committer_email=commit['committer_email'],
+        committer_date=commit['committer_date'],
+        message=_indent_message(commit['message']),
+        patch=commit['patch'])
+
+
 @tool
 def get_commit_changes(commit_id: str) -> str:
     """
     Fetch the changes in a git commit using commit ID.
+    Large diffs are truncated; use get_commit_stats for the full list of
+    changed files and line counts.
 
     Args:
         commit_id: The git commit hash/ID to fetch changes for
@@ -33,40 +445,27 @@ def get_commit_changes(commit_id: str) -> str:
         String containing the commit changes including diff, author, date, and message
     """
     try:
-        repo_path = get_repo_path()
-        git_cmd_base = ['git', '-C', repo_path] if repo_path else ['git']
-
-        # Get commit details (author, date, message)
-        commit_info = subprocess.run(
-            git_cmd_base + ['show', '--no-patch',
-                            '--format=fuller', commit_id],
-            capture_output=True,
-            text=True,
-            check=True
-        )
-
-        # Get commit diff
-        commit_diff = subprocess.run(
-            git_cmd_base + ['show', commit_id],
-            capture_output=True,
-            text=True,
-            check=True
-        )
-
-        result = f"""
-Commit Information:
-{commit_info.stdout}
-
-Changes:
-{commit_diff.stdout}
-"""
-        return result
+        return _get_commit_changes_impl(
+            get_repo_path(), _resolve_commit(commit_id))
     except subprocess.CalledProcessError as e:
         return f"Error fetching commit {commit_id}: {e.stderr}"
     except Exception as e:
         return f"Error: {str(e)}"
 
 
+@lru_cache(maxsize=256)
+def _get_commit_summary_impl(repo_path: Optional[str], sha: str) -> str:
+    """Format the get_commit_summary tool output for a commit."""
+    commit = _load_commit(repo_path, sha)
+    return _COMMIT_SUMMARY_TEMPLATE.format(
+        sha=commit['sha'],
+        author_name=commit['author_name'],
+        author_email=commit['author_email'],
+        author_date=commit['author_date'],
+        subject=commit['subject'],
+        files=_format_name_status(commit['files']))
+
+
 @tool
 def get_commit_summary(commit_id: str) -> str:
     """
@@ -79,43 +478,28 @@ def get_commit_summary(commit_id: str) -> str:
         String containing commit summary
     """
     try:
-        repo_path = get_repo_path()
-        git_cmd_base = ['git', '-C', repo_path] if repo_path else ['git']
-
-        # Get commit message and metadata
-        commit_info = subprocess.run(
-            git_cmd_base + ['log', '-1',
-                            '--format=%H%n%an%n%ae%n%ad%n%s%n%b', commit_id],
-            capture_output=True,
-            text=True,
-            check=True
-        )
-
-        # Get list of files changed
-        files_changed = subprocess.run(
-            git_cmd_base + ['show', '--name-status', '--format=', commit_id],
-            capture_output=True,
-            text=True,
-            check=True
-        )
-
-        lines = commit_info.stdout.strip().split('\n')
-        result = f"""
-Commit ID: {lines[0] if len(lines) > 0 else 'N/A'}
-Author: {lines[1] if len(lines) > 1 else 'N/A'} <{lines[2] if len(lines) > 2 else 'N/A'}>
-Date: {lines[3] if len(lines) > 3 else 'N/A'}
-Subject: {lines[4] if len(lines) > 4 else 'N/A'}
-
-Files Changed:
-{files_changed.stdout}
-"""
-        return result
+        return _get_commit_summary_impl(
+            get_repo_path(), _resolve_commit(commit_id))
     except subprocess.CalledProcessError as e:
         return f"Error fetching commit summary {commit_id}: {e.stderr}"
     except Exception as e:
         return f"Error: {str(e)}"
 
 
+@lru_cache(maxsize=256)
+def _get_commit_stats_impl(repo_path: Optional[str], sha: str) -> str:
+    """Format the get_commit_stats tool output for a commit."""
+    commit = _load_commit(repo_path, sha)
+    return _COMMIT_STATS_TEMPLATE.format(
+        sha=commit['sha'],
+        merge=_format_merge(commit['parents']),
+        author_name=commit['author_name'],
+        author_email=commit['author_email'],
+        author_date=commit['author_date'],
+        message=_indent_message(commit['message']),
+        stat=_format_stat(commit['numstat']))
+
+
 @tool
 def get_commit_stats(commit_id: str) -> str:
     """
@@ -128,16 +512,8 @@ def get_commit_stats(commit_id: str) -> str:
         String containing commit statistics
     """
     try:
-        repo_path = get_repo_path()
-        git_cmd_base = ['git', '-C', repo_path] if repo_path else ['git']
-
-        stats = subprocess.run(
-            git_cmd_base + ['show', '--stat', commit_id],
-            capture_output=True,
-            text=True,
-            check=True
-        )
-        return stats.stdout
+        return _get_commit_stats_impl(
+            get_repo_path(), _resolve_commit(commit_id))
     except subprocess.CalledProcessError as e:
         return f"Error fetching commit stats {commit_id}: {e.stderr}"
     except Exception as e:
@@ -148,38 +524,22 @@ def get_commit_stats(commit_id: str) -> str:
 def get_staged_changes() -> str:
     """
     Get the staged changes (changes added to index but not yet committed).
-    This analyzes changes that are ready to be committed.
+    This analyzes changes that are ready to be committed. Large diffs are
+    truncated; use get_staged_changes_stats for the full list of changes.
 
     Returns:
         String containing the staged changes with diff
     """
     try:
-        repo_path = get_repo_path()
-        git_cmd_base = ['git', '-C', repo_path] if repo_path else ['git']
-
-        # Check if there are any staged changes
-        status = subprocess.run(
-            git_cmd_base + ['diff', '--cached', '--name-only'],
-            capture_output=True,
-            text=True,
-            check=True
-        )
-
-        if not status.stdout.strip():
-            return "No staged changes found. Please stage your changes using 'git add' first."
+        staged = _load_staged()
 
-        # Get the diff of staged changes
-        diff = subprocess.run(
-            git_cmd_base + ['diff', '--cached'],
-            capture_output=True,
-            text=True,
-            check=True
-        )
+        if not staged['files']:
+            return "No staged changes found. Please stage your changes using 'git add' first."
 
         result = f"""
 Staged Changes (Ready to Commit):
 
-{diff.stdout}
+{staged['patch']}
 """
         return result
     except subprocess.CalledProcessError as e:
@@ -197,45 +557,23 @@ def get_staged_changes_summary() -> str:
         String containing summary of staged changes
     """
     try:
-        repo_path = get_repo_path()
-        git_cmd_base = ['git', '-C', repo_path] if repo_path else ['git']
-
-        # Get list of staged files with status
-        files_status = subprocess.run(
-            git_cmd_base + ['diff', '--cached', '--name-status'],
-            capture_output=True,
-            text=True,
-            check=True
-        )
-
-        if not files_status.stdout.strip():
-            return "No staged changes found."
+        staged = _load_staged()
 
-        # Get statistics
-        stats = subprocess.run(
-            git_cmd_base + ['diff', '--cached', '--stat'],
-            capture_output=True,
-            text=True,
-            check=True
-        )
+        if not staged['files']:
+            return "No staged changes found."
 
         # Get current branch
-        branch = subprocess.run(
-            git_cmd_base + ['branch', '--show-current'],
-            capture_output=True,
-            text=True,
-            check=True
-        )
+        branch = _git(['branch', '--show-current'])
 
         result = f"""
 Staged Changes Summary:
-Branch: {branch.stdout.strip()}
+Branch: {branch.decode('utf-8', 'replace').strip()}
 
 Files Status:
-{files_status.stdout}
+{_format_name_status(staged['files'])}
 
 Statistics:
-{stats.stdout}
+{_format_stat(staged['numstat'])}
 """
         return result
     except subprocess.CalledProcessError as e:
@@ -253,36 +591,19 @@ def get_staged_changes_stats() -> str:
         String containing statistics of staged changes
     """
     try:
-        repo_path = get_repo_path()
-        git_cmd_base = ['git', '-C', repo_path] if repo_path else ['git']
-
-        # Get statistics with numstat for detailed line changes
-        numstat = subprocess.run(
-            git_cmd_base + ['diff', '--cached', '--numstat'],
-            capture_output=True,
-            text=True,
-            check=True
-        )
-
-        if not numstat.stdout.strip():
-            return "No staged changes found."
+        staged = _load_staged()
 
-        # Get overall stats
-        stats = subprocess.run(
-            git_cmd_base + ['diff', '--cached', '--stat'],
-            capture_output=True,
-            text=True,
-            check=True
-        )
+        if not staged['numstat']:
+            return "No staged changes found."
 
         result = f"""
 Staged Changes Statistics:
 
 Detailed Line Changes:
-{numstat.stdout}
+{_format_numstat(staged['numstat'])}
 
 Summary:
-{stats.stdout}
+{_format_stat(staged['numstat'])}
 """
         return result
     except subprocess.CalledProcessError as e: